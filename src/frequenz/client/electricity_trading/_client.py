@@ -3,10 +3,11 @@
 
 """Module to define the client class."""
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Awaitable, cast
+from typing import AsyncIterator, Awaitable, Iterable, cast
 
 import grpc
 
@@ -69,16 +70,14 @@ def validate_decimal_places(value: Decimal, decimal_places: int, name: str) -> N
     if decimal_places < 0:
         raise ValueError("The decimal places must be a non-negative integer.")
 
-    try:
-        exponent = int(value.as_tuple().exponent)
-        if abs(exponent) > decimal_places:
-            raise ValueError(
-                f"The {name} cannot have more than {decimal_places} decimal places."
-            )
-    except InvalidOperation as exc:
+    if not value.is_finite():
+        raise ValueError(f"The value {value} for {name} is not a valid decimal number.")
+
+    exponent = int(value.as_tuple().exponent)
+    if -exponent > decimal_places:
         raise ValueError(
-            f"The value {value} for {name} is not a valid decimal number."
-        ) from exc
+            f"The {name} cannot have more than {decimal_places} decimal places."
+        )
 
 
 class Client(BaseApiClient[ElectricityTradingServiceStub]):
@@ -412,6 +411,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         """
         Create a gridpool order.
 
+        Invalid or unsupported orders raise a `ValueError` or `NotImplementedError`.
+
         Args:
             gridpool_id: ID of the gridpool to create the order for.
             delivery_area: Delivery area of the order.
@@ -478,6 +479,60 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
 
         return OrderDetail.from_pb(response.order_detail)
 
+    async def create_gridpool_orders(
+        self,
+        gridpool_id: int,
+        orders: Iterable[Order],
+        max_concurrency: int = 10,
+    ) -> list[OrderDetail | Exception]:
+        """
+        Create several gridpool orders with concurrent requests.
+
+        Unlike the other methods, this one returns errors instead of raising them,
+        so that created orders are not lost when others fail: the exception raised
+        by `create_gridpool_order` for an order, e.g. a `ValueError`,
+        `grpc.RpcError` or `decimal.InvalidOperation`, takes its place in the result.
+
+        Args:
+            gridpool_id: ID of the gridpool to create the orders for.
+            orders: The orders to create.
+            max_concurrency: The maximum number of requests sent at the same time.
+
+        Returns:
+            Either the created order or the exception raised for it, for each order.
+
+        Raises:
+            ValueError: If `max_concurrency` is not positive.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+        errors = (grpc.RpcError, ValueError, NotImplementedError, InvalidOperation)
+
+        async def create(order: Order) -> OrderDetail | Exception:
+            async with semaphore:
+                try:
+                    return await self.create_gridpool_order(
+                        gridpool_id,
+                        delivery_area=order.delivery_area,
+                        delivery_period=order.delivery_period,
+                        order_type=order.type,
+                        side=order.side,
+                        price=order.price,
+                        quantity=order.quantity,
+                        stop_price=order.stop_price,
+                        peak_price_delta=order.peak_price_delta,
+                        display_quantity=order.display_quantity,
+                        execution_option=order.execution_option,
+                        valid_until=order.valid_until,
+                        payload=order.payload,
+                        tag=order.tag,
+                    )
+                except errors as e:
+                    return e
+
+        return await asyncio.gather(*(create(order) for order in orders))
+
     async def update_gridpool_order(
         # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
         self,
@@ -711,51 +766,117 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
 
         Returns:
             The list of orders for that gridpool.
-
-        Raises:
-            grpc.RpcError: If an error occurs while listing the orders.
         """
-        gridpool_order_filer = GridpoolOrderFilter(
+        gridpool_order_filter = GridpoolOrderFilter(
             order_states=order_states,
             side=side,
             delivery_period=delivery_period,
             delivery_area=delivery_area,
             tag=tag,
         )
+        orders, _ = await self._list_gridpool_orders_page(
+            gridpool_id, gridpool_order_filter, max_nr_orders, page_token
+        )
+        return orders
 
-        pagination_params = Params(
-            page_size=max_nr_orders,
-            page_token=page_token,
+    async def list_all_gridpool_orders(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        page_size: int | None = None,
+    ) -> AsyncIterator[OrderDetail]:
+        """
+        Iterate over all orders for a specific Gridpool, fetching them page by page.
+
+        Meant for backfilling; use `stream_gridpool_orders` to follow live updates.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            page_size: The maximum number of orders to fetch per request.
+
+        Yields:
+            The orders for that gridpool.
+        """
+        gridpool_order_filter = GridpoolOrderFilter(
+            order_states=order_states,
+            side=side,
+            delivery_period=delivery_period,
+            delivery_area=delivery_area,
+            tag=tag,
         )
 
+        page_token: str | None = None
+        while True:
+            orders, page_token = await self._list_gridpool_orders_page(
+                gridpool_id, gridpool_order_filter, page_size, page_token
+            )
+            for order in orders:
+                yield order
+            if not page_token:
+                break
+
+    async def _list_gridpool_orders_page(
+        self,
+        gridpool_id: int,
+        gridpool_order_filter: GridpoolOrderFilter,
+        page_size: int | None,
+        page_token: str | None,
+    ) -> tuple[list[OrderDetail], str]:
+        """
+        Fetch a single page of orders, skipping those that cannot be converted.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            gridpool_order_filter: The filter to apply to the orders.
+            page_size: The maximum number of orders to return.
+            page_token: The page token to use for pagination.
+
+        Returns:
+            The orders and the next page token, which is empty on the last page.
+
+        Raises:
+            grpc.RpcError: If an error occurs while listing the orders.
+        """
+        pagination_params = Params(page_size=page_size, page_token=page_token)
+
         try:
             response = await cast(
                 Awaitable[electricity_trading_pb2.ListGridpoolOrdersResponse],
                 self.stub.ListGridpoolOrders(
                     electricity_trading_pb2.ListGridpoolOrdersRequest(
                         gridpool_id=gridpool_id,
-                        filter=gridpool_order_filer.to_pb(),
+                        filter=gridpool_order_filter.to_pb(),
                         pagination_params=pagination_params.to_proto(),
                     ),
                     metadata=self._metadata,
                 ),
             )
-
-            orders: list[OrderDetail] = []
-            for order_detail in response.order_details:
-                try:
-                    orders.append(OrderDetail.from_pb(order_detail))
-                except InvalidOperation:
-                    _logger.error(
-                        "Failed to convert order details for order: %s",
-                        str(order_detail).replace("\n", ""),
-                    )
-
-            return orders
         except grpc.RpcError as e:
             _logger.exception("Error occurred while listing gridpool orders: %s", e)
             raise
 
+        orders: list[OrderDetail] = []
+        for order_detail in response.order_details:
+            try:
+                orders.append(OrderDetail.from_pb(order_detail))
+            except InvalidOperation:
+                _logger.error(
+                    "Failed to convert order details for order: %s",
+                    str(order_detail).replace("\n", ""),
+                )
+
+        return orders, response.pagination_info.next_page_token
+
     async def list_gridpool_trades(
         # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
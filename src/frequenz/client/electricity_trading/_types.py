@@ -23,6 +23,25 @@ from google.protobuf import json_format, struct_pb2, timestamp_pb2
 
 _logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _datetime_to_pb(dt: datetime) -> timestamp_pb2.Timestamp:
+    """Convert a datetime to a protobuf Timestamp.
+
+    Args:
+        dt: Datetime to convert. Naive datetimes are interpreted as UTC.
+
+    Returns:
+        Protobuf Timestamp corresponding to the datetime.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - _EPOCH
+    return timestamp_pb2.Timestamp(
+        seconds=delta.days * 86400 + delta.seconds, nanos=delta.microseconds * 1000
+    )
+
 
 # From frequanz.api.common
 class Currency(enum.Enum):
@@ -65,22 +84,22 @@ class Currency(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == currency for e in cls):
+        try:
+            return cls(currency)
+        except ValueError:
             _logger.warning("Unknown currency %s. Returning UNSPECIFIED.", currency)
             return cls.UNSPECIFIED
 
-        return cls(currency)
-
     def to_pb(self) -> price_pb2.Price.Currency.ValueType:
         """Convert a Currency object to protobuf Currency.
 
         Returns:
             Protobuf message corresponding to the Currency object.
         """
-        return price_pb2.Price.Currency.ValueType(self.value)
+        return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """Price of an order."""
 
@@ -116,7 +135,7 @@ class Price:
         return price_pb2.Price(amount=decimal_amount, currency=self.currency.to_pb())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Power:
     """Represents power unit in Megawatthours (MW)."""
 
@@ -179,25 +198,25 @@ class EnergyMarketCodeType(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == energy_market_code_type for e in cls):
+        try:
+            return cls(energy_market_code_type)
+        except ValueError:
             _logger.warning(
                 "Unknown energy market code type %s. Returning UNSPECIFIED.",
                 energy_market_code_type,
             )
             return cls.UNSPECIFIED
 
-        return cls(energy_market_code_type)
-
     def to_pb(self) -> delivery_area_pb2.EnergyMarketCodeType.ValueType:
         """Convert a EnergyMarketCodeType object to protobuf EnergyMarketCodeType.
 
         Returns:
             Protobuf message corresponding to the EnergyMarketCodeType object.
         """
-        return delivery_area_pb2.EnergyMarketCodeType.ValueType(self.value)
+        return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeliveryArea:
     """
     Geographical or administrative region.
@@ -273,22 +292,22 @@ class DeliveryDuration(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == delivery_duration for e in cls):
+        try:
+            return cls(delivery_duration)
+        except ValueError:
             _logger.warning(
                 "Unknown delivery duration %s. Returning UNSPECIFIED.",
                 delivery_duration,
             )
             return cls.UNSPECIFIED
 
-        return cls(delivery_duration)
-
     def to_pb(self) -> delivery_duration_pb2.DeliveryDuration.ValueType:
         """Convert a DeliveryDuration object to protobuf DeliveryDuration.
 
         Returns:
             Protobuf message corresponding to the DeliveryDuration object.
         """
-        return delivery_duration_pb2.DeliveryDuration.ValueType(self.value)
+        return self.value
 
 
 class DeliveryPeriod:
@@ -298,6 +317,8 @@ class DeliveryPeriod:
     It is defined by a start timestamp and a duration.
     """
 
+    __slots__ = ("start", "duration")
+
     start: datetime
     """Start UTC timestamp represents the beginning of the delivery period.
         This timestamp is inclusive, meaning that the delivery period starts
@@ -324,12 +345,7 @@ class DeliveryPeriod:
         """
         if start.tzinfo is None:
             raise ValueError("Start timestamp must have a timezone.")
-        if start.tzinfo != timezone.utc:
-            _logger.warning(
-                "Start timestamp is not in UTC timezone. Converting to UTC."
-            )
-            start = start.astimezone(timezone.utc)
-        self.start = start
+        self.start = start.astimezone(timezone.utc)
 
         minutes = duration.total_seconds() / 60
         match minutes:
@@ -402,10 +418,8 @@ class DeliveryPeriod:
         Returns:
             Protobuf message corresponding to the DeliveryPeriod object.
         """
-        start = timestamp_pb2.Timestamp()
-        start.FromDatetime(self.start)
         return delivery_duration_pb2.DeliveryPeriod(
-            start=start,
+            start=_datetime_to_pb(self.start),
             duration=self.duration.to_pb(),
         )
 
@@ -452,22 +466,22 @@ class OrderExecutionOption(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == order_execution_option for e in OrderExecutionOption):
+        try:
+            return cls(order_execution_option)
+        except ValueError:
             _logger.warning(
-                "Unknown forecast feature %s. Returning UNSPECIFIED.",
+                "Unknown order execution option %s. Returning UNSPECIFIED.",
                 order_execution_option,
             )
             return cls.UNSPECIFIED
 
-        return OrderExecutionOption(order_execution_option)
-
     def to_pb(self) -> electricity_trading_pb2.OrderExecutionOption.ValueType:
         """Convert a OrderExecutionOption object to protobuf OrderExecutionOption.
 
         Returns:
             Protobuf message corresponding to the OrderExecutionOption object.
         """
-        return electricity_trading_pb2.OrderExecutionOption.ValueType(self.value)
+        return self.value
 
 
 class OrderType(enum.Enum):
@@ -516,12 +530,12 @@ class OrderType(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == order_type for e in cls):
+        try:
+            return cls(order_type)
+        except ValueError:
             _logger.warning("Unknown order type %s. Returning UNSPECIFIED.", order_type)
             return cls.UNSPECIFIED
 
-        return cls(order_type)
-
     def to_pb(self) -> electricity_trading_pb2.OrderType.ValueType:
         """Convert an OrderType enum to protobuf OrderType value.
 
@@ -555,14 +569,14 @@ class MarketSide(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == market_side for e in cls):
+        try:
+            return cls(market_side)
+        except ValueError:
             _logger.warning(
                 "Unknown market side %s. Returning UNSPECIFIED.", market_side
             )
             return cls.UNSPECIFIED
 
-        return cls(market_side)
-
     def to_pb(self) -> electricity_trading_pb2.MarketSide.ValueType:
         """Convert a MarketSide enum to protobuf MarketSide value.
 
@@ -617,14 +631,14 @@ class OrderState(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == order_state for e in cls):
+        try:
+            return cls(order_state)
+        except ValueError:
             _logger.warning(
                 "Unknown order state %s. Returning UNSPECIFIED.", order_state
             )
             return cls.UNSPECIFIED
 
-        return cls(order_state)
-
     def to_pb(self) -> electricity_trading_pb2.OrderState.ValueType:
         """Convert an OrderState enum to protobuf OrderState value.
 
@@ -680,14 +694,14 @@ class TradeState(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == trade_state for e in cls):
+        try:
+            return cls(trade_state)
+        except ValueError:
             _logger.warning(
                 "Unknown trade state %s. Returning UNSPECIFIED.", trade_state
             )
             return cls.UNSPECIFIED
 
-        return cls(trade_state)
-
     def to_pb(self) -> electricity_trading_pb2.TradeState.ValueType:
         """Convert a TradeState enum to protobuf TradeState value.
 
@@ -781,14 +795,14 @@ class StateReason(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == state_reason for e in cls):
+        try:
+            return cls(state_reason)
+        except ValueError:
             _logger.warning(
                 "Unknown state reason %s. Returning UNSPECIFIED.", state_reason
             )
             return cls.UNSPECIFIED
 
-        return cls(state_reason)
-
     def to_pb(
         self,
     ) -> electricity_trading_pb2.OrderDetail.StateDetail.StateReason.ValueType:
@@ -834,14 +848,14 @@ class MarketActor(enum.Enum):
         Returns:
             Enum value corresponding to the protobuf message.
         """
-        if not any(e.value == market_actor for e in cls):
+        try:
+            return cls(market_actor)
+        except ValueError:
             _logger.warning(
                 "Unknown market actor %s. Returning UNSPECIFIED.", market_actor
             )
             return cls.UNSPECIFIED
 
-        return cls(market_actor)
-
     def to_pb(
         self,
     ) -> electricity_trading_pb2.OrderDetail.StateDetail.MarketActor.ValueType:
@@ -904,9 +918,7 @@ class Order:  # pylint: disable=too-many-instance-attributes
         if self.valid_until is not None:
             if self.valid_until.tzinfo is None:
                 raise ValueError("Valid until must be a UTC datetime.")
-            if self.valid_until.tzinfo != timezone.utc:
-                _logger.warning("Valid until is not a UTC datetime. Converting to UTC.")
-                self.valid_until = self.valid_until.astimezone(timezone.utc)
+            self.valid_until = self.valid_until.astimezone(timezone.utc)
 
     @classmethod
     def from_pb(cls, order: electricity_trading_pb2.Order) -> Self:
@@ -961,16 +973,12 @@ class Order:  # pylint: disable=too-many-instance-attributes
         Returns:
             Protobuf message corresponding to the Order object.
         """
-        if self.valid_until:
-            valid_until = timestamp_pb2.Timestamp()
-            valid_until.FromDatetime(self.valid_until)
-        else:
-            valid_until = None
+        valid_until = _datetime_to_pb(self.valid_until) if self.valid_until else None
         return electricity_trading_pb2.Order(
             delivery_area=self.delivery_area.to_pb(),
             delivery_period=self.delivery_period.to_pb(),
-            type=electricity_trading_pb2.OrderType.ValueType(self.type.value),
-            side=electricity_trading_pb2.MarketSide.ValueType(self.side.value),
+            type=self.type.to_pb(),
+            side=self.side.to_pb(),
             price=self.price.to_pb(),
             quantity=self.quantity.to_pb(),
             stop_price=self.stop_price.to_pb() if self.stop_price else None,
@@ -981,11 +989,7 @@ class Order:  # pylint: disable=too-many-instance-attributes
                 self.display_quantity.to_pb() if self.display_quantity else None
             ),
             execution_option=(
-                electricity_trading_pb2.OrderExecutionOption.ValueType(
-                    self.execution_option.value
-                )
-                if self.execution_option
-                else None
+                self.execution_option.to_pb() if self.execution_option else None
             ),
             valid_until=valid_until,
             payload=struct_pb2.Struct(fields=self.payload) if self.payload else None,
@@ -1029,9 +1033,7 @@ class Trade:  # pylint: disable=too-many-instance-attributes
         """Post initialization checks to ensure that all datetimes are UTC."""
         if self.execution_time.tzinfo is None:
             raise ValueError("Execution time must have timezone information")
-        if self.execution_time.tzinfo != timezone.utc:
-            _logger.warning("Execution timenis not in UTC timezone. Converting to UTC.")
-            self.execution_time = self.execution_time.astimezone(timezone.utc)
+        self.execution_time = self.execution_time.astimezone(timezone.utc)
 
     @classmethod
     def from_pb(cls, trade: electricity_trading_pb2.Trade) -> Self:
@@ -1061,23 +1063,20 @@ class Trade:  # pylint: disable=too-many-instance-attributes
         Returns:
             Protobuf message corresponding to the Trade object.
         """
-        execution_time = timestamp_pb2.Timestamp()
-        execution_time.FromDatetime(self.execution_time)
-
         return electricity_trading_pb2.Trade(
             id=self.id,
             order_id=self.order_id,
-            side=electricity_trading_pb2.MarketSide.ValueType(self.side.value),
+            side=self.side.to_pb(),
             delivery_area=self.delivery_area.to_pb(),
             delivery_period=self.delivery_period.to_pb(),
-            execution_time=execution_time,
+            execution_time=_datetime_to_pb(self.execution_time),
             price=self.price.to_pb(),
             quantity=self.quantity.to_pb(),
-            state=electricity_trading_pb2.TradeState.ValueType(self.state.value),
+            state=self.state.to_pb(),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDetail:
     """Details about the current state of the order."""
 
@@ -1115,13 +1114,9 @@ class StateDetail:
             Protobuf message corresponding to the StateDetail object.
         """
         return electricity_trading_pb2.OrderDetail.StateDetail(
-            state=electricity_trading_pb2.OrderState.ValueType(self.state.value),
-            state_reason=electricity_trading_pb2.OrderDetail.StateDetail.StateReason.ValueType(
-                self.state_reason.value
-            ),
-            market_actor=electricity_trading_pb2.OrderDetail.StateDetail.MarketActor.ValueType(
-                self.market_actor.value
-            ),
+            state=self.state.to_pb(),
+            state_reason=self.state_reason.to_pb(),
+            market_actor=self.market_actor.to_pb(),
         )
 
 
@@ -1158,17 +1153,11 @@ class OrderDetail:
         """
         if self.create_time.tzinfo is None:
             raise ValueError("Create time must have timezone information")
-        if self.create_time.tzinfo != timezone.utc:
-            _logger.warning("Create time is not in UTC timezone. Converting to UTC.")
-            self.create_time = self.create_time.astimezone(timezone.utc)
+        self.create_time = self.create_time.astimezone(timezone.utc)
 
         if self.modification_time.tzinfo is None:
             raise ValueError("Modification time must have timezone information")
-        if self.modification_time.tzinfo != timezone.utc:
-            _logger.warning(
-                "Modification time is not in UTC timezone. Converting to UTC."
-            )
-            self.modification_time = self.modification_time.astimezone(timezone.utc)
+        self.modification_time = self.modification_time.astimezone(timezone.utc)
 
     @classmethod
     def from_pb(cls, order_detail: electricity_trading_pb2.OrderDetail) -> Self:
@@ -1198,19 +1187,14 @@ class OrderDetail:
         Returns:
             Protobuf message corresponding to the OrderDetail object.
         """
-        create_time = timestamp_pb2.Timestamp()
-        create_time.FromDatetime(self.create_time)
-        modification_time = timestamp_pb2.Timestamp()
-        modification_time.FromDatetime(self.modification_time)
-
         return electricity_trading_pb2.OrderDetail(
             order_id=self.order_id,
             order=self.order.to_pb(),
             state_detail=self.state_detail.to_pb(),
             open_quantity=self.open_quantity.to_pb(),
             filled_quantity=self.filled_quantity.to_pb(),
-            create_time=create_time,
-            modification_time=modification_time,
+            create_time=_datetime_to_pb(self.create_time),
+            modification_time=_datetime_to_pb(self.modification_time),
         )
 
 
@@ -1246,9 +1230,7 @@ class PublicTrade:  # pylint: disable=too-many-instance-attributes
         """Post initialization checks to ensure that all datetimes are UTC."""
         if self.execution_time.tzinfo is None:
             raise ValueError("Execution time must have timezone information")
-        if self.execution_time.tzinfo != timezone.utc:
-            _logger.warning("Execution time is not in UTC timezone. Converting to UTC.")
-            self.execution_time = self.execution_time.astimezone(timezone.utc)
+        self.execution_time = self.execution_time.astimezone(timezone.utc)
 
     @classmethod
     def from_pb(cls, public_trade: electricity_trading_pb2.PublicTrade) -> Self:
@@ -1277,18 +1259,15 @@ class PublicTrade:  # pylint: disable=too-many-instance-attributes
         Returns:
             Protobuf message corresponding to the PublicTrade object.
         """
-        execution_time = timestamp_pb2.Timestamp()
-        execution_time.FromDatetime(self.execution_time)
-
         return electricity_trading_pb2.PublicTrade(
             id=self.public_trade_id,
             buy_delivery_area=self.buy_delivery_area.to_pb(),
             sell_delivery_area=self.sell_delivery_area.to_pb(),
             delivery_period=self.delivery_period.to_pb(),
-            execution_time=execution_time,
+            execution_time=_datetime_to_pb(self.execution_time),
             price=self.price.to_pb(),
             quantity=self.quantity.to_pb(),
-            state=electricity_trading_pb2.TradeState.ValueType(self.state.value),
+            state=self.state.to_pb(),
         )
 
 
@@ -1396,18 +1375,9 @@ class GridpoolOrderFilter:
         """
         return electricity_trading_pb2.GridpoolOrderFilter(
             states=(
-                [
-                    electricity_trading_pb2.OrderState.ValueType(state.value)
-                    for state in self.order_states
-                ]
-                if self.order_states
-                else None
-            ),
-            side=(
-                electricity_trading_pb2.MarketSide.ValueType(self.side.value)
-                if self.side
-                else None
+                map(OrderState.to_pb, self.order_states) if self.order_states else None
             ),
+            side=(self.side.to_pb() if self.side else None),
             delivery_period=(
                 self.delivery_period.to_pb() if self.delivery_period else None
             ),
@@ -1521,9 +1491,7 @@ class GridpoolTradeFilter:
         """
         return electricity_trading_pb2.GridpoolTradeFilter(
             states=(
-                [TradeState.to_pb(state) for state in self.trade_states]
-                if self.trade_states
-                else None
+                map(TradeState.to_pb, self.trade_states) if self.trade_states else None
             ),
             trade_ids=self.trade_ids if self.trade_ids else None,
             side=MarketSide.to_pb(self.side) if self.side else None,
@@ -1627,14 +1595,7 @@ class PublicTradeFilter:
             Protobuf PublicTradeFilter corresponding to the object.
         """
         return electricity_trading_pb2.PublicTradeFilter(
-            states=(
-                [
-                    electricity_trading_pb2.TradeState.ValueType(state.value)
-                    for state in self.states
-                ]
-                if self.states
-                else None
-            ),
+            states=map(TradeState.to_pb, self.states) if self.states else None,
             delivery_period=(
                 self.delivery_period.to_pb() if self.delivery_period else None
             ),
@@ -1693,9 +1654,7 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
         if self.valid_until is not None:
             if self.valid_until.tzinfo is None:
                 raise ValueError("Valid until must be a UTC datetime.")
-            if self.valid_until.tzinfo != timezone.utc:
-                _logger.warning("Valid until is not a UTC datetime. Converting to UTC.")
-                self.valid_until = self.valid_until.astimezone(timezone.utc)
+            self.valid_until = self.valid_until.astimezone(timezone.utc)
 
     @classmethod
     def from_pb(
@@ -1760,11 +1719,7 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
         Returns:
             Protobuf UpdateOrder corresponding to the object.
         """
-        if self.valid_until:
-            valid_until = timestamp_pb2.Timestamp()
-            valid_until.FromDatetime(self.valid_until)
-        else:
-            valid_until = None
+        valid_until = _datetime_to_pb(self.valid_until) if self.valid_until else None
         return electricity_trading_pb2.UpdateGridpoolOrderRequest.UpdateOrder(
             price=self.price.to_pb() if self.price else None,
             quantity=self.quantity.to_pb() if self.quantity else None,
@@ -1776,11 +1731,7 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
                 self.display_quantity.to_pb() if self.display_quantity else None
             ),
             execution_option=(
-                electricity_trading_pb2.OrderExecutionOption.ValueType(
-                    self.execution_option.value
-                )
-                if self.execution_option
-                else None
+                self.execution_option.to_pb() if self.execution_option else None
             ),
             valid_until=valid_until if self.valid_until else None,
             payload=struct_pb2.Struct(fields=self.payload) if self.payload else None,
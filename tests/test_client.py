@@ -5,14 +5,16 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
+import grpc
 import pytest
 
 # pylint: disable=no-member
+from frequenz.api.common.v1.pagination import pagination_info_pb2
 from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
 from google.protobuf import timestamp_pb2
-from typing_extensions import Any, Generator
+from typing_extensions import Any, AsyncGenerator
 
 from frequenz.client.electricity_trading import (
     Client,
@@ -34,71 +36,96 @@ from frequenz.client.electricity_trading import (
     TradeState,
 )
 
+# All tests share the session event loop instead of creating one per test
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="module")
+def order_params() -> dict[str, Any]:
+    """Set up the order parameters shared by all tests of the module."""
+    # Setting delivery start to the next day 12:00
+    delivery_start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
+        hour=12, minute=0, second=0, microsecond=0
+    )
+    return {
+        "gridpool_id": 123,
+        "delivery_area": DeliveryArea(
+            code="DE", code_type=EnergyMarketCodeType.EUROPE_EIC
+        ),
+        "delivery_period": DeliveryPeriod(
+            start=delivery_start,
+            duration=timedelta(minutes=15),
+        ),
+        "order_type": OrderType.LIMIT,
+        "side": MarketSide.BUY,
+        "price": Price(amount=Decimal("50"), currency=Currency.EUR),
+        "quantity": Power(mw=Decimal("0.1")),
+        "order_execution_option": OrderExecutionOption.AON,
+        "valid_until": delivery_start + timedelta(hours=3),
+    }
+
+
+# pylint: disable=redefined-outer-name
+@pytest.fixture(scope="module")
+def order_detail_responses(
+    order_params: dict[str, Any],
+) -> dict[int, electricity_trading_pb2.OrderDetail]:
+    """Build the order detail responses once per module, keyed by order ID."""
+    return {
+        order_id: set_up_order_detail_response(order_params, order_id)
+        for order_id in (1, 2, 3)
+    }
+
+
+async def empty_stream(*_: Any, **__: Any) -> AsyncGenerator[Any, None]:
+    """Stand in for a server stream that ends without sending any message."""
+    return
+    yield  # pylint: disable=unreachable
+
 
 @pytest.fixture
-def set_up() -> Generator[Any, Any, Any]:
+async def set_up(order_params: dict[str, Any]) -> AsyncGenerator[Any, Any]:
     """Set up the test suite."""
     # Create a mock client and stub
     _ = Client("grpc://unknown.host", connect=False)
     mock_stub = AsyncMock()
+    # The streaming RPCs return async iterators, not awaitables
+    for stream_method in (
+        "ReceiveGridpoolOrdersStream",
+        "ReceiveGridpoolTradesStream",
+        "ReceivePublicTradesStream",
+    ):
+        setattr(mock_stub, stream_method, MagicMock(side_effect=empty_stream))
     _._stub = mock_stub  # pylint: disable=protected-access
 
-    # Create a new event loop for each test
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    yield {"client": _, "mock_stub": mock_stub, **order_params}
 
-    # Set up the parameters for the orders
-    # Setting delivery start to the next day 12:00
-    delivery_start = (datetime.now(timezone.utc) + timedelta(days=1)).replace(
-        hour=12, minute=0, second=0, microsecond=0
-    )
-    gridpool_id = 123
-    delivery_area = DeliveryArea(code="DE", code_type=EnergyMarketCodeType.EUROPE_EIC)
-    delivery_period = DeliveryPeriod(
-        start=delivery_start,
-        duration=timedelta(minutes=15),
-    )
-    order_type = OrderType.LIMIT
-    side = MarketSide.BUY
-    price = Price(amount=Decimal("50"), currency=Currency.EUR)
-    quantity = Power(mw=Decimal("0.1"))
-    order_execution_option = OrderExecutionOption.AON
-    valid_until = delivery_start + timedelta(hours=3)
-
-    yield {
-        "client": _,
-        "mock_stub": mock_stub,
-        "loop": loop,
-        "gridpool_id": gridpool_id,
-        "delivery_area": delivery_area,
-        "delivery_period": delivery_period,
-        "order_type": order_type,
-        "side": side,
-        "price": price,
-        "quantity": quantity,
-        "order_execution_option": order_execution_option,
-        "valid_until": valid_until,
-    }
-
-    loop.close()
+    # Stop the streams started by the test, as the event loop outlives the test
+    # pylint: disable=protected-access
+    for streams in (
+        _._gridpool_orders_streams,
+        _._gridpool_trades_streams,
+        _._public_trades_streams,
+    ):
+        for broadcaster in streams.values():
+            await broadcaster.stop()
 
 
-# pylint: disable=redefined-outer-name
 def set_up_order_detail_response(
-    set_up: dict[str, Any],
+    order_params: dict[str, Any],
     order_id: int = 1,
 ) -> electricity_trading_pb2.OrderDetail:
     """Set up an order detail response."""
     return OrderDetail(
         order_id=order_id,
         order=Order(
-            delivery_area=set_up["delivery_area"],
-            delivery_period=set_up["delivery_period"],
-            type=set_up["order_type"],
-            side=set_up["side"],
-            price=set_up["price"],
-            quantity=set_up["quantity"],
-            execution_option=set_up["order_execution_option"],
+            delivery_area=order_params["delivery_area"],
+            delivery_period=order_params["delivery_period"],
+            type=order_params["order_type"],
+            side=order_params["side"],
+            price=order_params["price"],
+            quantity=order_params["quantity"],
+            execution_option=order_params["order_execution_option"],
         ),
         state_detail=StateDetail(
             state=OrderState.ACTIVE,
@@ -107,32 +134,34 @@ def set_up_order_detail_response(
         ),
         open_quantity=Power(mw=Decimal("5.00")),
         filled_quantity=Power(mw=Decimal("0.00")),
-        create_time=set_up["delivery_period"].start - timedelta(hours=2),
-        modification_time=set_up["delivery_period"].start - timedelta(hours=1),
+        create_time=order_params["delivery_period"].start - timedelta(hours=2),
+        modification_time=order_params["delivery_period"].start - timedelta(hours=1),
     ).to_pb()
 
 
-def test_stream_gridpool_orders(set_up: dict[str, Any]) -> None:
+async def test_stream_gridpool_orders(set_up: dict[str, Any]) -> None:
     """Test the method streaming gridpool orders."""
-    set_up["loop"].run_until_complete(
-        set_up["client"].stream_gridpool_orders(set_up["gridpool_id"])
-    )
+    await set_up["client"].stream_gridpool_orders(set_up["gridpool_id"])
+    # Let the stream broadcaster task start and call the stub
+    await asyncio.sleep(0)
 
     set_up["mock_stub"].ReceiveGridpoolOrdersStream.assert_called_once()
     args, _ = set_up["mock_stub"].ReceiveGridpoolOrdersStream.call_args
     assert args[0].gridpool_id == set_up["gridpool_id"]
 
 
-def test_stream_gridpool_orders_with_optional_inputs(set_up: dict[str, Any]) -> None:
+async def test_stream_gridpool_orders_with_optional_inputs(
+    set_up: dict[str, Any]
+) -> None:
     """Test the method streaming gridpool orders with some fields to filter for."""
     # Fields to filter for
     order_states = [OrderState.ACTIVE]
 
-    set_up["loop"].run_until_complete(
-        set_up["client"].stream_gridpool_orders(
-            set_up["gridpool_id"], order_states=order_states
-        )
+    await set_up["client"].stream_gridpool_orders(
+        set_up["gridpool_id"], order_states=order_states
     )
+    # Let the stream broadcaster task start and call the stub
+    await asyncio.sleep(0)
 
     set_up["mock_stub"].ReceiveGridpoolOrdersStream.assert_called_once()
     args, _ = set_up["mock_stub"].ReceiveGridpoolOrdersStream.call_args
@@ -142,15 +171,15 @@ def test_stream_gridpool_orders_with_optional_inputs(set_up: dict[str, Any]) ->
     ]
 
 
-def test_stream_gridpool_trades(
+async def test_stream_gridpool_trades(
     set_up: dict[str, Any],
 ) -> None:
     """Test the method streaming gridpool trades."""
-    set_up["loop"].run_until_complete(
-        set_up["client"].stream_gridpool_trades(
-            gridpool_id=set_up["gridpool_id"], market_side=set_up["side"]
-        )
+    await set_up["client"].stream_gridpool_trades(
+        gridpool_id=set_up["gridpool_id"], market_side=set_up["side"]
     )
+    # Let the stream broadcaster task start and call the stub
+    await asyncio.sleep(0)
 
     set_up["mock_stub"].ReceiveGridpoolTradesStream.assert_called_once()
     args, _ = set_up["mock_stub"].ReceiveGridpoolTradesStream.call_args
@@ -158,16 +187,16 @@ def test_stream_gridpool_trades(
     assert args[0].filter.side == set_up["side"].to_pb()
 
 
-def test_stream_public_trades(
+async def test_stream_public_trades(
     set_up: dict[str, Any],
 ) -> None:
     """Test the method streaming public trades."""
     # Fields to filter for
     trade_states = [TradeState.ACTIVE]
 
-    set_up["loop"].run_until_complete(
-        set_up["client"].stream_public_trades(states=trade_states)
-    )
+    await set_up["client"].stream_public_trades(states=trade_states)
+    # Let the stream broadcaster task start and call the stub
+    await asyncio.sleep(0)
 
     set_up["mock_stub"].ReceivePublicTradesStream.assert_called_once()
     args, _ = set_up["mock_stub"].ReceivePublicTradesStream.call_args
@@ -176,8 +205,9 @@ def test_stream_public_trades(
     ]
 
 
-def test_create_gridpool_order(
+async def test_create_gridpool_order(
     set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
 ) -> None:
     """
     Test the method creating a gridpool order.
@@ -186,23 +216,21 @@ def test_create_gridpool_order(
     """
     # Setup the expected response with valid values,
     # especially so that the DeliveryPeriod does not raise an error
-    order_detail_response = set_up_order_detail_response(set_up)
+    order_detail_response = order_detail_responses[1]
     mock_response = electricity_trading_pb2.CreateGridpoolOrderResponse(
         order_detail=order_detail_response
     )
     set_up["mock_stub"].CreateGridpoolOrder.return_value = mock_response
 
-    set_up["loop"].run_until_complete(
-        set_up["client"].create_gridpool_order(
-            gridpool_id=set_up["gridpool_id"],
-            delivery_area=set_up["delivery_area"],
-            delivery_period=set_up["delivery_period"],
-            order_type=set_up["order_type"],
-            side=set_up["side"],
-            price=set_up["price"],
-            quantity=set_up["quantity"],
-            execution_option=set_up["order_execution_option"],  # optional field
-        )
+    await set_up["client"].create_gridpool_order(
+        gridpool_id=set_up["gridpool_id"],
+        delivery_area=set_up["delivery_area"],
+        delivery_period=set_up["delivery_period"],
+        order_type=set_up["order_type"],
+        side=set_up["side"],
+        price=set_up["price"],
+        quantity=set_up["quantity"],
+        execution_option=set_up["order_execution_option"],  # optional field
     )
 
     set_up["mock_stub"].CreateGridpoolOrder.assert_called_once()
@@ -216,25 +244,151 @@ def test_create_gridpool_order(
     assert args[0].order.execution_option == set_up["order_execution_option"].to_pb()
 
 
-def test_update_gridpool_order(
+async def test_create_gridpool_orders(
     set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
+) -> None:
+    """Test the method creating several gridpool orders at once."""
+    set_up["mock_stub"].CreateGridpoolOrder.side_effect = [
+        electricity_trading_pb2.CreateGridpoolOrderResponse(
+            order_detail=order_detail_responses[order_id]
+        )
+        for order_id in (1, 2)
+    ]
+    orders = [
+        Order(
+            delivery_area=set_up["delivery_area"],
+            delivery_period=set_up["delivery_period"],
+            type=set_up["order_type"],
+            side=side,
+            price=set_up["price"],
+            quantity=set_up["quantity"],
+        )
+        for side in (MarketSide.BUY, MarketSide.SELL)
+    ]
+
+    order_details = await set_up["client"].create_gridpool_orders(
+        gridpool_id=set_up["gridpool_id"], orders=orders
+    )
+
+    assert [order_detail.order_id for order_detail in order_details] == [1, 2]
+    assert set_up["mock_stub"].CreateGridpoolOrder.call_count == 2
+    requests = [
+        call.args[0] for call in set_up["mock_stub"].CreateGridpoolOrder.call_args_list
+    ]
+    assert [request.gridpool_id for request in requests] == [set_up["gridpool_id"]] * 2
+    assert [request.order for request in requests] == [
+        order.to_pb() for order in orders
+    ]
+
+
+async def test_create_gridpool_orders_partial_failure(
+    set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
+) -> None:
+    """Test that failing orders do not hide the orders that were created."""
+    error = grpc.RpcError()
+    set_up["mock_stub"].CreateGridpoolOrder.side_effect = [
+        error,
+        # An empty order detail cannot be converted
+        electricity_trading_pb2.CreateGridpoolOrderResponse(),
+        electricity_trading_pb2.CreateGridpoolOrderResponse(
+            order_detail=order_detail_responses[2]
+        ),
+    ]
+    order = Order(
+        delivery_area=set_up["delivery_area"],
+        delivery_period=set_up["delivery_period"],
+        type=set_up["order_type"],
+        side=set_up["side"],
+        price=set_up["price"],
+        quantity=set_up["quantity"],
+    )
+    invalid_order = Order(
+        delivery_area=set_up["delivery_area"],
+        delivery_period=set_up["delivery_period"],
+        type=set_up["order_type"],
+        side=set_up["side"],
+        price=Price(amount=Decimal("50.123"), currency=set_up["price"].currency),
+        quantity=set_up["quantity"],
+    )
+
+    results = await set_up["client"].create_gridpool_orders(
+        gridpool_id=set_up["gridpool_id"],
+        orders=[order, order, invalid_order, order],
+        max_concurrency=1,
+    )
+
+    assert set_up["mock_stub"].CreateGridpoolOrder.call_count == 3
+    assert results[0] is error
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], ValueError)
+    assert isinstance(results[3], OrderDetail)
+    assert results[3].order_id == 2
+
+
+async def test_create_gridpool_orders_max_concurrency(
+    set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
+) -> None:
+    """Test that no more than `max_concurrency` requests are sent at a time."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create_order(
+        *_: Any, **__: Any
+    ) -> electricity_trading_pb2.CreateGridpoolOrderResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return electricity_trading_pb2.CreateGridpoolOrderResponse(
+            order_detail=order_detail_responses[1]
+        )
+
+    set_up["mock_stub"].CreateGridpoolOrder.side_effect = create_order
+    order = Order(
+        delivery_area=set_up["delivery_area"],
+        delivery_period=set_up["delivery_period"],
+        type=set_up["order_type"],
+        side=set_up["side"],
+        price=set_up["price"],
+        quantity=set_up["quantity"],
+    )
+
+    results = await set_up["client"].create_gridpool_orders(
+        gridpool_id=set_up["gridpool_id"], orders=[order] * 5, max_concurrency=2
+    )
+
+    assert len(results) == 5
+    assert all(isinstance(result, OrderDetail) for result in results)
+    assert max_in_flight == 2
+
+    with pytest.raises(ValueError):
+        await set_up["client"].create_gridpool_orders(
+            gridpool_id=set_up["gridpool_id"], orders=[order], max_concurrency=0
+        )
+
+
+async def test_update_gridpool_order(
+    set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
 ) -> None:
     """Test the method updating a gridpool order."""
     # Setup the expected response with valid values,
     # especially so that the DeliveryPeriod does not raise an error
-    order_detail_response = set_up_order_detail_response(set_up)
+    order_detail_response = order_detail_responses[1]
     mock_response = electricity_trading_pb2.UpdateGridpoolOrderResponse(
         order_detail=order_detail_response
     )
     set_up["mock_stub"].UpdateGridpoolOrder.return_value = mock_response
 
-    set_up["loop"].run_until_complete(
-        set_up["client"].update_gridpool_order(
-            gridpool_id=set_up["gridpool_id"],
-            order_id=1,
-            quantity=set_up["quantity"],
-            valid_until=set_up["valid_until"],
-        )
+    await set_up["client"].update_gridpool_order(
+        gridpool_id=set_up["gridpool_id"],
+        order_id=1,
+        quantity=set_up["quantity"],
+        valid_until=set_up["valid_until"],
     )
 
     valid_until_pb = timestamp_pb2.Timestamp()
@@ -250,13 +404,14 @@ def test_update_gridpool_order(
     ), "Price field should not be set."
 
 
-def test_cancel_gridpool_order(
+async def test_cancel_gridpool_order(
     set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
 ) -> None:
     """Test the method cancelling gridpool orders."""
     # Setup the expected response with valid values,
     # especially so that the DeliveryPeriod does not raise an error
-    order_detail_response = set_up_order_detail_response(set_up)
+    order_detail_response = order_detail_responses[1]
     mock_response = electricity_trading_pb2.CancelGridpoolOrderResponse(
         order_detail=order_detail_response
     )
@@ -266,10 +421,8 @@ def test_cancel_gridpool_order(
 
     set_up["mock_stub"].CancelGridpoolOrder.return_value = mock_response
 
-    set_up["loop"].run_until_complete(
-        set_up["client"].cancel_gridpool_order(
-            gridpool_id=set_up["gridpool_id"], order_id=order_id
-        )
+    await set_up["client"].cancel_gridpool_order(
+        gridpool_id=set_up["gridpool_id"], order_id=order_id
     )
 
     set_up["mock_stub"].CancelGridpoolOrder.assert_called_once()
@@ -278,13 +431,14 @@ def test_cancel_gridpool_order(
     assert args[0].order_id == order_id
 
 
-def test_list_gridpool_orders(
+async def test_list_gridpool_orders(
     set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
 ) -> None:
     """Test the method listing gridpool orders."""
     # Setup the expected response with valid values,
     # especially so that the DeliveryPeriod does not raise an error
-    order_detail_response = set_up_order_detail_response(set_up)
+    order_detail_response = order_detail_responses[1]
     mock_response = electricity_trading_pb2.ListGridpoolOrdersResponse(
         order_details=[order_detail_response]
     )
@@ -294,10 +448,8 @@ def test_list_gridpool_orders(
     side = MarketSide.BUY
     order_states = [OrderState.ACTIVE]
 
-    set_up["loop"].run_until_complete(
-        set_up["client"].list_gridpool_orders(
-            gridpool_id=set_up["gridpool_id"], side=side, order_states=order_states
-        )
+    await set_up["client"].list_gridpool_orders(
+        gridpool_id=set_up["gridpool_id"], side=side, order_states=order_states
     )
 
     set_up["mock_stub"].ListGridpoolOrders.assert_called_once()
@@ -308,6 +460,42 @@ def test_list_gridpool_orders(
     assert args[0].filter.side == side.to_pb()
 
 
+async def test_list_all_gridpool_orders(
+    set_up: dict[str, Any],
+    order_detail_responses: dict[int, electricity_trading_pb2.OrderDetail],
+) -> None:
+    """Test the method listing all gridpool orders page by page."""
+    set_up["mock_stub"].ListGridpoolOrders.side_effect = [
+        electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[
+                order_detail_responses[1],
+                order_detail_responses[2],
+            ],
+            pagination_info=pagination_info_pb2.PaginationInfo(
+                total_items=3, next_page_token="page-2"
+            ),
+        ),
+        electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[order_detail_responses[3]],
+            pagination_info=pagination_info_pb2.PaginationInfo(total_items=3),
+        ),
+    ]
+
+    orders = [
+        order
+        async for order in set_up["client"].list_all_gridpool_orders(
+            gridpool_id=set_up["gridpool_id"], page_size=2
+        )
+    ]
+
+    assert [order.order_id for order in orders] == [1, 2, 3]
+    assert set_up["mock_stub"].ListGridpoolOrders.call_count == 2
+    first_call, second_call = set_up["mock_stub"].ListGridpoolOrders.call_args_list
+    assert first_call.args[0].pagination_params.page_size == 2
+    assert not first_call.args[0].pagination_params.HasField("page_token")
+    assert second_call.args[0].pagination_params.page_token == "page-2"
+
+
 @pytest.mark.parametrize(
     "price, quantity, delivery_period, valid_until, execution_option, expected_exception",
     [
@@ -373,7 +561,7 @@ def test_list_gridpool_orders(
         ),
     ],
 )
-def test_create_gridpool_order_with_invalid_params(
+async def test_create_gridpool_order_with_invalid_params(
     # pylint: disable=too-many-arguments, too-many-positional-arguments
     set_up: dict[str, Any],
     price: Price,
@@ -385,18 +573,16 @@ def test_create_gridpool_order_with_invalid_params(
 ) -> None:
     """Test creating an order with invalid input parameters."""
     with pytest.raises(expected_exception):
-        set_up["loop"].run_until_complete(
-            set_up["client"].create_gridpool_order(
-                gridpool_id=set_up["gridpool_id"],
-                delivery_area=set_up["delivery_area"],
-                delivery_period=delivery_period,
-                order_type=OrderType.LIMIT,
-                side=MarketSide.BUY,
-                price=price,
-                quantity=quantity,
-                execution_option=execution_option,
-                valid_until=valid_until,
-            )
+        await set_up["client"].create_gridpool_order(
+            gridpool_id=set_up["gridpool_id"],
+            delivery_area=set_up["delivery_area"],
+            delivery_period=delivery_period,
+            order_type=OrderType.LIMIT,
+            side=MarketSide.BUY,
+            price=price,
+            quantity=quantity,
+            execution_option=execution_option,
+            valid_until=valid_until,
         )
 
 
@@ -426,7 +612,7 @@ def test_create_gridpool_order_with_invalid_params(
         ),
     ],
 )
-def test_update_gridpool_order_with_invalid_params(  # pylint: disable=too-many-arguments
+async def test_update_gridpool_order_with_invalid_params(  # pylint: disable=too-many-arguments
     set_up: dict[str, Any],
     price: Price,
     quantity: Power,
@@ -435,12 +621,10 @@ def test_update_gridpool_order_with_invalid_params(  # pylint: disable=too-many-
 ) -> None:
     """Test updating an order with invalid input parameters."""
     with pytest.raises(expected_exception):
-        set_up["loop"].run_until_complete(
-            set_up["client"].update_gridpool_order(
-                gridpool_id=set_up["gridpool_id"],
-                order_id=1,
-                price=price,
-                quantity=quantity,
-                valid_until=valid_until,
-            )
+        await set_up["client"].update_gridpool_order(
+            gridpool_id=set_up["gridpool_id"],
+            order_id=1,
+            price=price,
+            quantity=quantity,
+            valid_until=valid_until,
         )
@@ -3,12 +3,13 @@
 
 """Tests for the type conversions used with the client."""
 
+import dataclasses
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Any, Callable, TypeVar
+from typing import Any
+from zoneinfo import ZoneInfo
 
 import pytest
-from deepdiff import DeepDiff
 
 # pylint: disable=no-member
 from frequenz.api.common.v1.grid import delivery_area_pb2, delivery_duration_pb2
@@ -40,42 +41,59 @@ from frequenz.client.electricity_trading import (
     TradeState,
     UpdateOrder,
 )
-
-T = TypeVar("T")
+from frequenz.client.electricity_trading._types import _datetime_to_pb
 
 # Set up some constants for reusability
-START_TIME = datetime.fromisoformat("2023-01-01T12:00:00+00:00")
-START_TIME_PB = timestamp_pb2.Timestamp(seconds=1672574400)
-EXECUTION_TIME = datetime.fromisoformat("2024-01-03T10:00:00+00:00")
-EXECUTION_TIME_PB = timestamp_pb2.Timestamp(seconds=1704276000)
-CREATE_TIME = datetime.fromisoformat("2023-01-01T12:00:00+00:00")
-CREATE_TIME_PB = timestamp_pb2.Timestamp(seconds=1672574400)
-MODIFICATION_TIME = datetime.fromisoformat("2023-01-01T12:00:00+00:00")
-MODIFICATION_TIME_PB = timestamp_pb2.Timestamp(seconds=1672574400)
+START_TIME = CREATE_TIME = MODIFICATION_TIME = datetime(
+    2023, 1, 1, 12, tzinfo=timezone.utc
+)
+START_TIME_PB = CREATE_TIME_PB = MODIFICATION_TIME_PB = timestamp_pb2.Timestamp()
+START_TIME_PB.FromDatetime(START_TIME)
+EXECUTION_TIME = datetime(2024, 1, 3, 10, tzinfo=timezone.utc)
+EXECUTION_TIME_PB = timestamp_pb2.Timestamp()
+EXECUTION_TIME_PB.FromDatetime(EXECUTION_TIME)
+PRICE_AMOUNT = Decimal("100.00")
+QUANTITY_MW = Decimal("5.00")
+ZERO_MW = Decimal("0.00")
+QUANTITY = Power(mw=QUANTITY_MW)
+ZERO_QUANTITY = Power(mw=ZERO_MW)
+STATE_DETAIL = StateDetail(
+    state=OrderState.ACTIVE,
+    state_reason=StateReason.ADD,
+    market_actor=MarketActor.USER,
+)
+DELIVERY_AREA_XYZ_PB = delivery_area_pb2.DeliveryArea(
+    code="XYZ",
+    code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
+)
+DELIVERY_AREA_ABC_PB = delivery_area_pb2.DeliveryArea(
+    code="ABC",
+    code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
+)
+DELIVERY_PERIOD_PB = delivery_duration_pb2.DeliveryPeriod(
+    start=START_TIME_PB,
+    duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
+)
+PRICE_PB = price_pb2.Price(
+    amount=decimal_pb2.Decimal(value="100.00"),
+    currency=price_pb2.Price.Currency.CURRENCY_USD,
+)
+QUANTITY_PB = power_pb2.Power(mw=decimal_pb2.Decimal(value="5.00"))
 ORDER = Order(
     delivery_area=DeliveryArea(code="XYZ", code_type=EnergyMarketCodeType.EUROPE_EIC),
     delivery_period=DeliveryPeriod(start=START_TIME, duration=timedelta(minutes=15)),
     type=OrderType.LIMIT,
     side=MarketSide.BUY,
-    price=Price(amount=Decimal("100.00"), currency=Currency.USD),
-    quantity=Power(mw=Decimal("5.00")),
+    price=Price(amount=PRICE_AMOUNT, currency=Currency.USD),
+    quantity=QUANTITY,
 )
 ORDER_PB = electricity_trading_pb2.Order(
-    delivery_area=delivery_area_pb2.DeliveryArea(
-        code="XYZ",
-        code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-    ),
-    delivery_period=delivery_duration_pb2.DeliveryPeriod(
-        start=START_TIME_PB,
-        duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-    ),
+    delivery_area=DELIVERY_AREA_XYZ_PB,
+    delivery_period=DELIVERY_PERIOD_PB,
     type=electricity_trading_pb2.OrderType.ORDER_TYPE_LIMIT,
     side=electricity_trading_pb2.MarketSide.MARKET_SIDE_BUY,
-    price=price_pb2.Price(
-        amount=decimal_pb2.Decimal(value="100.00"),
-        currency=price_pb2.Price.Currency.CURRENCY_USD,
-    ),
-    quantity=power_pb2.Power(mw=decimal_pb2.Decimal(value="5.00")),
+    price=PRICE_PB,
+    quantity=QUANTITY_PB,
 )
 TRADE = Trade(
     id=1,
@@ -84,8 +102,8 @@ TRADE = Trade(
     execution_time=EXECUTION_TIME,
     delivery_area=DeliveryArea(code="XYZ", code_type=EnergyMarketCodeType.EUROPE_EIC),
     delivery_period=DeliveryPeriod(START_TIME, duration=timedelta(minutes=15)),
-    price=Price(amount=Decimal("100.00"), currency=Currency.USD),
-    quantity=Power(mw=Decimal("5.00")),
+    price=Price(amount=PRICE_AMOUNT, currency=Currency.USD),
+    quantity=QUANTITY,
     state=TradeState.ACTIVE,
 )
 
@@ -94,32 +112,19 @@ TRADE_PB = electricity_trading_pb2.Trade(
     order_id=2,
     side=electricity_trading_pb2.MarketSide.MARKET_SIDE_BUY,
     execution_time=EXECUTION_TIME_PB,
-    delivery_area=delivery_area_pb2.DeliveryArea(
-        code="XYZ",
-        code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-    ),
-    delivery_period=delivery_duration_pb2.DeliveryPeriod(
-        start=START_TIME_PB,
-        duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-    ),
-    price=price_pb2.Price(
-        amount=decimal_pb2.Decimal(value="100.00"),
-        currency=price_pb2.Price.Currency.CURRENCY_USD,
-    ),
-    quantity=power_pb2.Power(mw=decimal_pb2.Decimal(value="5.00")),
+    delivery_area=DELIVERY_AREA_XYZ_PB,
+    delivery_period=DELIVERY_PERIOD_PB,
+    price=PRICE_PB,
+    quantity=QUANTITY_PB,
     state=electricity_trading_pb2.TradeState.TRADE_STATE_ACTIVE,
 )
 
 ORDER_DETAIL = OrderDetail(
     order_id=1,
     order=ORDER,
-    state_detail=StateDetail(
-        state=OrderState.ACTIVE,
-        state_reason=StateReason.ADD,
-        market_actor=MarketActor.USER,
-    ),
-    open_quantity=Power(mw=Decimal("5.00")),
-    filled_quantity=Power(mw=Decimal("0.00")),
+    state_detail=STATE_DETAIL,
+    open_quantity=QUANTITY,
+    filled_quantity=ZERO_QUANTITY,
     create_time=CREATE_TIME,
     modification_time=MODIFICATION_TIME,
 )
@@ -131,7 +136,7 @@ ORDER_DETAIL_PB = electricity_trading_pb2.OrderDetail(
         state_reason=electricity_trading_pb2.OrderDetail.StateDetail.StateReason.STATE_REASON_ADD,
         market_actor=electricity_trading_pb2.OrderDetail.StateDetail.MarketActor.MARKET_ACTOR_USER,
     ),
-    open_quantity=power_pb2.Power(mw=decimal_pb2.Decimal(value="5.00")),
+    open_quantity=QUANTITY_PB,
     filled_quantity=power_pb2.Power(mw=decimal_pb2.Decimal(value="0.00")),
     create_time=CREATE_TIME_PB,
     modification_time=MODIFICATION_TIME_PB,
@@ -146,30 +151,18 @@ PUBLIC_TRADE = PublicTrade(
     ),
     delivery_period=DeliveryPeriod(start=START_TIME, duration=timedelta(minutes=15)),
     execution_time=EXECUTION_TIME,
-    price=Price(amount=Decimal("100.00"), currency=Currency.USD),
-    quantity=Power(mw=Decimal("5.00")),
+    price=Price(amount=PRICE_AMOUNT, currency=Currency.USD),
+    quantity=QUANTITY,
     state=TradeState.ACTIVE,
 )
 PUBLIC_TRADE_PB = electricity_trading_pb2.PublicTrade(
     id=1,
-    buy_delivery_area=delivery_area_pb2.DeliveryArea(
-        code="XYZ",
-        code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-    ),
-    sell_delivery_area=delivery_area_pb2.DeliveryArea(
-        code="ABC",
-        code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-    ),
-    delivery_period=delivery_duration_pb2.DeliveryPeriod(
-        start=START_TIME_PB,
-        duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-    ),
+    buy_delivery_area=DELIVERY_AREA_XYZ_PB,
+    sell_delivery_area=DELIVERY_AREA_ABC_PB,
+    delivery_period=DELIVERY_PERIOD_PB,
     execution_time=EXECUTION_TIME_PB,
-    price=price_pb2.Price(
-        amount=decimal_pb2.Decimal(value="100.00"),
-        currency=price_pb2.Price.Currency.CURRENCY_USD,
-    ),
-    quantity=power_pb2.Power(mw=decimal_pb2.Decimal(value="5.00")),
+    price=PRICE_PB,
+    quantity=QUANTITY_PB,
     state=electricity_trading_pb2.TradeState.TRADE_STATE_ACTIVE,
 )
 
@@ -186,14 +179,8 @@ GRIDPOOL_ORDER_FILTER_PB = electricity_trading_pb2.GridpoolOrderFilter(
         electricity_trading_pb2.OrderState.ORDER_STATE_CANCELED,
     ],
     side=electricity_trading_pb2.MarketSide.MARKET_SIDE_BUY,
-    delivery_period=delivery_duration_pb2.DeliveryPeriod(
-        start=START_TIME_PB,
-        duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-    ),
-    delivery_area=delivery_area_pb2.DeliveryArea(
-        code="XYZ",
-        code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-    ),
+    delivery_period=DELIVERY_PERIOD_PB,
+    delivery_area=DELIVERY_AREA_XYZ_PB,
     tag="test",
 )
 
@@ -213,67 +200,89 @@ PUBLIC_TRADE_FILTER_PB = electricity_trading_pb2.PublicTradeFilter(
         electricity_trading_pb2.TradeState.TRADE_STATE_ACTIVE,
         electricity_trading_pb2.TradeState.TRADE_STATE_CANCELED,
     ],
-    buy_delivery_area=delivery_area_pb2.DeliveryArea(
-        code="XYZ",
-        code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-    ),
-    delivery_period=delivery_duration_pb2.DeliveryPeriod(
-        start=START_TIME_PB,
-        duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-    ),
+    buy_delivery_area=DELIVERY_AREA_XYZ_PB,
+    delivery_period=DELIVERY_PERIOD_PB,
 )
 
-UPDATE_ORDER = UpdateOrder(price=Price(amount=Decimal("100.00"), currency=Currency.USD))
+UPDATE_ORDER = UpdateOrder(price=Price(amount=PRICE_AMOUNT, currency=Currency.USD))
 UPDATE_ORDER_PB = electricity_trading_pb2.UpdateGridpoolOrderRequest.UpdateOrder(
-    price=price_pb2.Price(
-        amount=decimal_pb2.Decimal(value="100.00"),
-        currency=price_pb2.Price.Currency.CURRENCY_USD,
-    )
+    price=PRICE_PB
 )
 
 
-def assert_conversion_to_pb(
-    original: Any,
-    expected_pb: T,
-    assert_func: Callable[[T, T], None],
-) -> None:
-    """
-    Test conversion from a custom type to protobuf (generic utility function).
-
-    original: The original instance of the custom type.
-    expected_pb: The expected protobuf instance.
-    assert_func: Function to assert equality between two protobuf instances.
-    """
-    converted_pb = original.to_pb()
-    assert_func(converted_pb, expected_pb)
-
+# Pairs of client type instances and their protobuf counterparts, checked in both
+# conversion directions
+CONVERSION_CASES = [
+    pytest.param(
+        Price(amount=Decimal("100"), currency=Currency.USD),
+        price_pb2.Price(
+            amount=decimal_pb2.Decimal(value="100"),
+            currency=price_pb2.Price.Currency.CURRENCY_USD,
+        ),
+        id="price-usd",
+    ),
+    pytest.param(
+        Price(amount=Decimal("100"), currency=Currency.EUR),
+        price_pb2.Price(
+            amount=decimal_pb2.Decimal(value="100"),
+            currency=price_pb2.Price.Currency.CURRENCY_EUR,
+        ),
+        id="price-eur",
+    ),
+    pytest.param(
+        Power(mw=Decimal("5")),
+        power_pb2.Power(mw=decimal_pb2.Decimal(value="5")),
+        id="power",
+    ),
+    pytest.param(
+        DeliveryDuration.MINUTES_15,
+        delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
+        id="delivery-duration",
+    ),
+    pytest.param(
+        DeliveryPeriod(start=START_TIME, duration=timedelta(minutes=15)),
+        DELIVERY_PERIOD_PB,
+        id="delivery-period",
+    ),
+    pytest.param(
+        DeliveryArea(code="XYZ", code_type=EnergyMarketCodeType.EUROPE_EIC),
+        DELIVERY_AREA_XYZ_PB,
+        id="delivery-area",
+    ),
+    pytest.param(ORDER, ORDER_PB, id="order"),
+    pytest.param(TRADE, TRADE_PB, id="trade"),
+    pytest.param(ORDER_DETAIL, ORDER_DETAIL_PB, id="order-detail"),
+    pytest.param(PUBLIC_TRADE, PUBLIC_TRADE_PB, id="public-trade"),
+    pytest.param(
+        GRIDPOOL_ORDER_FILTER, GRIDPOOL_ORDER_FILTER_PB, id="gridpool-order-filter"
+    ),
+    pytest.param(
+        GRIDPOOL_ORDER_FILTER_EMPTY,
+        GRIDPOOL_ORDER_FILTER_EMPTY_PB,
+        id="gridpool-order-filter-empty",
+    ),
+    pytest.param(PUBLIC_TRADE_FILTER, PUBLIC_TRADE_FILTER_PB, id="public-trade-filter"),
+]
 
-def assert_conversion_from_pb(
-    original_pb: T,
-    expected: Any,
-    assert_func: Callable[[Any, Any], None],
-) -> None:
-    """
-    Test conversion from protobuf to a custom type (generic utility function).
 
-    original_pb: The original protobuf instance.
-    expected: The expected instance of the custom type.
-    assert_func: Function to assert equality between two instances of the custom type.
+def assert_equal(actual: Any, expected: Any) -> None:
     """
-    converted = expected.from_pb(original_pb)
-    assert_func(converted, expected)
+    Assert that two instances are equal, using DeepDiff to report differences.
 
+    Both protobuf messages and the custom types compare field by field with `==`,
+    so DeepDiff is only imported and run to describe the differences of a failing
+    comparison.
 
-def assert_equal(actual: Any, expected: Any) -> None:
+    actual: The actual instance.
+    expected: The expected instance.
     """
-    Assert that two instances are equal, using DeepDiff for detailed comparison.
+    assert type(actual) is type(expected), f"{type(actual)} != {type(expected)}"
+    if actual != expected:
+        # pylint: disable=import-outside-toplevel
+        from deepdiff import DeepDiff
 
-    actual_pb: The actual instance.
-    expected_pb: The expected instance.
-    """
-    assert isinstance(expected, type(actual))
-    diff = DeepDiff(actual, expected, ignore_order=True)
-    assert not diff, f"Differences found in comparison: {diff}"
+        diff = DeepDiff(actual, expected)
+        pytest.fail(f"Differences found in comparison: {diff}")
 
 
 def test_currency_from_pb() -> None:
@@ -285,106 +294,89 @@ def test_currency_from_pb() -> None:
     )
 
 
+def test_unknown_enum_value_from_pb() -> None:
+    """Test that unknown protobuf enum values are converted to UNSPECIFIED."""
+    assert (
+        Currency.from_pb(price_pb2.Price.Currency.ValueType(999))
+        == Currency.UNSPECIFIED
+    )
+    assert (
+        OrderState.from_pb(electricity_trading_pb2.OrderState.ValueType(999))
+        == OrderState.UNSPECIFIED
+    )
+
+
 def test_currency_to_pb() -> None:
     """Test the currency conversion from enum to protobuf."""
     assert Currency.EUR.to_pb() == price_pb2.Price.Currency.CURRENCY_EUR
     assert Currency.UNSPECIFIED.to_pb() == price_pb2.Price.Currency.CURRENCY_UNSPECIFIED
 
 
-def test_price_to_pb() -> None:
-    """Test the client price type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=Price(amount=Decimal("100"), currency=Currency.USD),
-        expected_pb=price_pb2.Price(
-            amount=decimal_pb2.Decimal(value="100"),
-            currency=price_pb2.Price.Currency.CURRENCY_USD,
-        ),
-        assert_func=assert_equal,
-    )
-
-
-def test_price_from_pb() -> None:
-    """Test the client price type conversions from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=price_pb2.Price(
-            amount=decimal_pb2.Decimal(value="100"),
-            currency=price_pb2.Price.Currency.CURRENCY_EUR,
-        ),
-        expected=Price(amount=Decimal("100"), currency=Currency.EUR),
-        assert_func=assert_equal,
-    )
+@pytest.mark.parametrize("original, expected_pb", CONVERSION_CASES)
+def test_to_pb(original: Any, expected_pb: Any) -> None:
+    """Test the client type conversions to protobuf."""
+    assert_equal(original.to_pb(), expected_pb)
 
 
-def test_energy_to_pb() -> None:
-    """Test the client energy type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=Power(mw=Decimal("5")),
-        expected_pb=power_pb2.Power(mw=decimal_pb2.Decimal(value="5")),
-        assert_func=assert_equal,
-    )
-
-
-def test_energy_from_pb() -> None:
-    """Test the client energy type conversions from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=power_pb2.Power(mw=decimal_pb2.Decimal(value="5")),
-        expected=Power(mw=Decimal("5")),
-        assert_func=assert_equal,
-    )
+@pytest.mark.parametrize("expected, original_pb", CONVERSION_CASES)
+def test_from_pb(expected: Any, original_pb: Any) -> None:
+    """Test the client type conversions from protobuf."""
+    assert_equal(type(expected).from_pb(original_pb), expected)
 
 
-def test_delivery_duration_to_pb() -> None:
-    """Test the client delivery duration type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=DeliveryDuration.MINUTES_15,
-        expected_pb=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-        assert_func=assert_equal,
-    )
-
+@pytest.mark.parametrize(
+    "dt",
+    [
+        START_TIME,
+        datetime(2024, 5, 1, 13, 15, 30, 123456, tzinfo=timezone(timedelta(hours=2))),
+        datetime(1969, 12, 31, 23, 59, 59, 500000, tzinfo=timezone.utc),
+        datetime(2024, 5, 1, 12, 0),
+        # The same ambiguous local time on both sides of the DST change; they
+        # compare equal but are an hour apart
+        datetime(2024, 10, 27, 2, 30, tzinfo=ZoneInfo("Europe/Berlin")),
+        datetime(2024, 10, 27, 2, 30, fold=1, tzinfo=ZoneInfo("Europe/Berlin")),
+    ],
+)
+def test_datetime_to_pb(dt: datetime) -> None:
+    """Test that datetimes are converted like `Timestamp.FromDatetime`."""
+    expected = timestamp_pb2.Timestamp()
+    expected.FromDatetime(dt)
 
-def test_delivery_duration_from_pb() -> None:
-    """Test the client delivery duration type conversions from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
-        expected=DeliveryDuration.MINUTES_15,
-        assert_func=assert_equal,
-    )
+    assert _datetime_to_pb(dt) == expected
 
 
-def test_delivery_period_to_pb() -> None:
-    """Test the client delivery period type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=DeliveryPeriod(start=START_TIME, duration=timedelta(minutes=15)),
-        expected_pb=delivery_duration_pb2.DeliveryPeriod(
-            start=START_TIME_PB,
-            duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
+@pytest.mark.parametrize(
+    "cls, kwargs",
+    [
+        pytest.param(
+            DeliveryPeriod,
+            {"start": datetime.now(timezone.utc), "duration": timedelta(minutes=10)},
+            id="delivery-period-invalid-duration",
         ),
-        assert_func=assert_equal,
-    )
-
-
-def test_delivery_period_from_pb() -> None:
-    """Test the client delivery period type conversions from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=delivery_duration_pb2.DeliveryPeriod(
-            start=START_TIME_PB,
-            duration=delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_15,
+        pytest.param(
+            DeliveryPeriod,
+            {"start": datetime.now(), "duration": timedelta(minutes=5)},
+            id="delivery-period-no-timezone",
         ),
-        expected=DeliveryPeriod(start=START_TIME, duration=timedelta(minutes=15)),
-        assert_func=assert_equal,
-    )
-
-
-def test_invalid_duration_raises_value_error() -> None:
-    """Test that an invalid duration raises a ValueError."""
-    with pytest.raises(ValueError):
-        DeliveryPeriod(start=datetime.now(timezone.utc), duration=timedelta(minutes=10))
-
-
-def test_no_timezone_raises_value_error() -> None:
-    """Test that a datetime without timezone raises a ValueError."""
+        pytest.param(
+            OrderDetail,
+            {
+                "order_id": 1,
+                "order": ORDER,
+                "state_detail": STATE_DETAIL,
+                "open_quantity": QUANTITY,
+                "filled_quantity": ZERO_QUANTITY,
+                "create_time": datetime.now(),
+                "modification_time": datetime.now(),
+            },
+            id="order-detail-no-timezone",
+        ),
+    ],
+)
+def test_invalid_inputs_raise_value_error(cls: type, kwargs: dict[str, Any]) -> None:
+    """Test that invalid durations or datetimes without timezone raise a ValueError."""
     with pytest.raises(ValueError):
-        DeliveryPeriod(start=datetime.now(), duration=timedelta(minutes=5))
+        cls(**kwargs)
 
 
 def test_invalid_timezone_converted_to_utc() -> None:
@@ -396,115 +388,15 @@ def test_invalid_timezone_converted_to_utc() -> None:
     assert start.hour == period.start.hour + 1
 
 
-def test_delivery_area_to_pb() -> None:
-    """Test the client delivery area type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=DeliveryArea(code="XYZ", code_type=EnergyMarketCodeType.EUROPE_EIC),
-        expected_pb=delivery_area_pb2.DeliveryArea(
-            code="XYZ",
-            code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-        ),
-        assert_func=assert_equal,
-    )
-
-
-def test_delivery_area_from_pb() -> None:
-    """Test the client delivery area type conversions from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=delivery_area_pb2.DeliveryArea(
-            code="XYZ",
-            code_type=delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_EUROPE_EIC,
-        ),
-        expected=DeliveryArea(code="XYZ", code_type=EnergyMarketCodeType.EUROPE_EIC),
-        assert_func=assert_equal,
-    )
-
-
-def test_order_to_pb() -> None:
-    """Test the client order type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=ORDER,
-        expected_pb=ORDER_PB,
-        assert_func=assert_equal,
-    )
-
-
-def test_order_from_pb() -> None:
-    """Test the client order type conversions from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=ORDER_PB,
-        expected=ORDER,
-        assert_func=assert_equal,
-    )
-
-
-def test_trade_to_pb() -> None:
-    """Test the client trade type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=TRADE,
-        expected_pb=TRADE_PB,
-        assert_func=assert_equal,
-    )
-
-
-def test_trade_from_pb() -> None:
-    """Test the client trade type conversions from protobuf."""
-    converted_trade = Trade.from_pb(TRADE_PB)
-
-    assert isinstance(converted_trade, Trade)
-    diff = DeepDiff(converted_trade, TRADE, ignore_order=True)
-    assert not diff
-
-
-def test_order_detail_to_pb() -> None:
-    """Test the client order detail type conversions to protobuf."""
-    assert_conversion_to_pb(
-        original=ORDER_DETAIL,
-        expected_pb=ORDER_DETAIL_PB,
-        assert_func=assert_equal,
-    )
-
-
-def test_order_detail_from_pb() -> None:
-    """Test the client order detail type conversion from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=ORDER_DETAIL_PB,
-        expected=ORDER_DETAIL,
-        assert_func=assert_equal,
-    )
-
-
-def test_order_detail_no_timezone_error() -> None:
-    """Test that an order detail with inputs with no timezone raises a ValueError."""
-    with pytest.raises(ValueError):
-        OrderDetail(
-            order_id=1,
-            order=ORDER,
-            state_detail=StateDetail(
-                state=OrderState.ACTIVE,
-                state_reason=StateReason.ADD,
-                market_actor=MarketActor.USER,
-            ),
-            open_quantity=Power(mw=Decimal("5.00")),
-            filled_quantity=Power(mw=Decimal("0.00")),
-            create_time=datetime.now(),
-            modification_time=datetime.now(),
-        )
-
-
 def test_order_detail_timezone_converted_to_utc() -> None:
     """Test that an order detail with inputs with non-UTC timezone is converted to UTC."""
     start = datetime.now(timezone(timedelta(hours=1)))
     order_detail = OrderDetail(
         order_id=1,
         order=ORDER,
-        state_detail=StateDetail(
-            state=OrderState.ACTIVE,
-            state_reason=StateReason.ADD,
-            market_actor=MarketActor.USER,
-        ),
-        open_quantity=Power(mw=Decimal("5.00")),
-        filled_quantity=Power(mw=Decimal("0.00")),
+        state_detail=STATE_DETAIL,
+        open_quantity=QUANTITY,
+        filled_quantity=ZERO_QUANTITY,
         create_time=start,
         modification_time=start,
     )
@@ -513,60 +405,6 @@ def test_order_detail_timezone_converted_to_utc() -> None:
     assert order_detail.modification_time.tzinfo == timezone.utc
 
 
-def test_gridpool_order_filter_to_pb() -> None:
-    """Test the client gridpool order filter type conversion to protobuf."""
-    assert_conversion_to_pb(
-        original=GRIDPOOL_ORDER_FILTER,
-        expected_pb=GRIDPOOL_ORDER_FILTER_PB,
-        assert_func=assert_equal,
-    )
-
-
-def test_gridpool_order_filter_from_pb() -> None:
-    """Test the client gridpool order filter type conversion from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=GRIDPOOL_ORDER_FILTER_PB,
-        expected=GRIDPOOL_ORDER_FILTER,
-        assert_func=assert_equal,
-    )
-
-
-def test_gridpool_order_filter_empty_to_pb() -> None:
-    """Test the client empty gridpool order filter type conversion to protobuf."""
-    assert_conversion_to_pb(
-        original=GRIDPOOL_ORDER_FILTER_EMPTY,
-        expected_pb=GRIDPOOL_ORDER_FILTER_EMPTY_PB,
-        assert_func=assert_equal,
-    )
-
-
-def test_gridpool_order_filter_empty_from_pb() -> None:
-    """Test the client empty gridpool order filter type conversion from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=GRIDPOOL_ORDER_FILTER_EMPTY_PB,
-        expected=GRIDPOOL_ORDER_FILTER_EMPTY,
-        assert_func=assert_equal,
-    )
-
-
-def test_public_trade_filter_to_pb() -> None:
-    """Test the client public trade filter type conversion to protobuf."""
-    assert_conversion_to_pb(
-        original=PUBLIC_TRADE_FILTER,
-        expected_pb=PUBLIC_TRADE_FILTER_PB,
-        assert_func=assert_equal,
-    )
-
-
-def test_public_trade_filter_from_pb() -> None:
-    """Test the client public trade filter type conversion from protobuf."""
-    assert_conversion_from_pb(
-        original_pb=PUBLIC_TRADE_FILTER_PB,
-        expected=PUBLIC_TRADE_FILTER,
-        assert_func=assert_equal,
-    )
-
-
 def test_update_order_to_pb() -> None:
     """Test the client update order type conversion to protobuf."""
     converted_update_order = UPDATE_ORDER.to_pb()
@@ -575,8 +413,7 @@ def test_update_order_to_pb() -> None:
         converted_update_order,
         electricity_trading_pb2.UpdateGridpoolOrderRequest.UpdateOrder,
     )
-    diff = DeepDiff(converted_update_order, UPDATE_ORDER_PB, ignore_order=True)
-    assert not diff
+    assert converted_update_order == UPDATE_ORDER_PB
     # Make sure the number of fields in original and converted are the same
     assert len(converted_update_order.ListFields()) == len(UPDATE_ORDER_PB.ListFields())
 
@@ -586,14 +423,17 @@ def test_update_order_from_pb() -> None:
     converted_update_order = UpdateOrder.from_pb(UPDATE_ORDER_PB)
 
     assert isinstance(converted_update_order, UpdateOrder)
-    diff = DeepDiff(converted_update_order, UPDATE_ORDER, ignore_order=True)
-    assert not diff
+    assert converted_update_order == UPDATE_ORDER
     # Make sure the number of non-None attributes in original and converted are the same
     non_none_attrs_converted = sum(
-        1 for v in vars(converted_update_order).values() if v is not None
+        1
+        for field in dataclasses.fields(UpdateOrder)
+        if getattr(converted_update_order, field.name) is not None
     )
     non_none_attrs_original = sum(
-        1 for v in vars(UPDATE_ORDER).values() if v is not None
+        1
+        for field in dataclasses.fields(UpdateOrder)
+        if getattr(UPDATE_ORDER, field.name) is not None
     )
     assert non_none_attrs_converted == non_none_attrs_original
 